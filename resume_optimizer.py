@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import google.generativeai as genai
 
 def setup_gemini(api_key: str):
@@ -9,9 +9,16 @@ def setup_gemini(api_key: str):
     model = genai.GenerativeModel('gemini-2.0-flash-exp')
     return model
 
-def optimize_resume(resume_json: Dict[str, Any], job_description: str, model) -> Dict[str, Any]:
+API_KEY = "paste your api key here"
+
+def optimize_resume(resume_json: Dict[str, Any], job_description: str, model,
+                    resume_fragment: Optional[str] = None, raise_on_error: bool = False) -> Dict[str, Any]:
     """
     Optimize the resume based on the job description using Gemini 2.0 Flash model.
+    If resume_fragment is given (a precomputed serialization of resume_json, e.g. from
+    a ProfileStore profile), it is used in the prompt instead of re-serializing the resume.
+    By default failures fall back to returning resume_json; with raise_on_error=True
+    they raise instead, so callers can tell an optimized result from the fallback.
     """
     # Gemini prompt for optimized resume JSON
     prompt = f"""
@@ -101,7 +108,7 @@ def optimize_resume(resume_json: Dict[str, Any], job_description: str, model) ->
     {job_description}
 
     Original Resume (JSON):
-    {json.dumps(resume_json, indent=2)}
+    {resume_fragment or json.dumps(resume_json, indent=2)}
 
     Now return only the final JSON resume object, including top-level 'role', 'company', and 'job_description' fields.
     """
@@ -120,11 +127,15 @@ def optimize_resume(resume_json: Dict[str, Any], job_description: str, model) ->
             optimized_resume = json.loads(json_str)
             return optimized_resume
         else:
+            if raise_on_error:
+                raise ValueError("Could not parse JSON from model response")
             # If no JSON found, return original resume
             print("Warning: Could not parse JSON from model response. Returning original resume.")
             return resume_json
             
     except Exception as e:
+        if raise_on_error:
+            raise
         print(f"Error optimizing resume: {e}")
         return resume_json
 
@@ -134,7 +145,7 @@ def main():
     print()
     
     # Use the hardcoded API key
-    api_key = "paste your api key here"
+    api_key = API_KEY
     print("Using provided API key...")
     
     try:
@@ -207,66 +207,90 @@ TEMPLATE = '''
 </html>
 '''
 
-def main():
-    parser = argparse.ArgumentParser(description='Generate HTML resume with custom naming')
-    parser.add_argument('--role', '-r', help='Job role/position you are applying for (overrides JD extraction)')
-    parser.add_argument('--company', '-c', help='Company name you are applying to (overrides JD extraction)')
-    parser.add_argument('--output-dir', '-o', default='resumes', help='Output directory for generated files')
-    parser.add_argument('--resume-data', '-d', default='optimized_resume.json', help='Path to resume JSON data')
-    parser.add_argument('--job-description', '-j', default='job_discription.txt', help='Path to job description file')
-    args = parser.parse_args()
-
-    # Prefer role/company from JSON, then CLI, then JD extraction
-    resume = load_resume_data(args.resume_data)
-    role_from_json = resume.get('role')
-    company_from_json = resume.get('company')
-    role = role_from_json or args.role
-    company = company_from_json or args.company
+def resolve_output_paths(resume, output_dir='resumes', role=None, company=None, jd_file='job_discription.txt'):
+    """Return (folder, html_file, pdf_file) for a resume, preferring role/company from JSON, then args, then the JD."""
+    role = resume.get('role') or role
+    company = resume.get('company') or company
     if not role or not company:
-        extracted_role, extracted_company = extract_role_and_company(args.job_description)
+        extracted_role, extracted_company = extract_role_and_company(jd_file)
         if not role and extracted_role:
             role = extracted_role
         if not company and extracted_company:
             company = extracted_company
     if role and company:
-        role_clean = sanitize_filename(role)
-        company_clean = sanitize_filename(company)
-        folder_name = f"{role_clean}_{company_clean}"
-        base_filename = "Resume"
+        folder_name = f"{sanitize_filename(role)}_{sanitize_filename(company)}"
     elif role:
-        role_clean = sanitize_filename(role)
-        folder_name = f"{role_clean}"
-        base_filename = "Resume"
+        folder_name = sanitize_filename(role)
     elif company:
-        company_clean = sanitize_filename(company)
-        folder_name = f"{company_clean}"
-        base_filename = "Resume"
+        folder_name = sanitize_filename(company)
     else:
         folder_name = "Generic"
-        base_filename = "Resume"
-    full_output_dir = os.path.join(args.output_dir, folder_name)
-    os.makedirs(full_output_dir, exist_ok=True)
+    base_filename = "Resume"
+    full_output_dir = os.path.join(output_dir, folder_name)
     html_file = os.path.join(full_output_dir, f"{base_filename}.html")
     pdf_file = os.path.join(full_output_dir, f"{base_filename}.pdf")
-    jd_dest = os.path.join(full_output_dir, "job_description.txt")
-    try:
-        import shutil
-        shutil.copy2(args.job_description, jd_dest)
-    except Exception:
-        pass
-    template = Template(TEMPLATE)
-    html = template.render(**resume)
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    return full_output_dir, html_file, pdf_file
+
+def load_template(path=None):
+    """Return the Jinja2 template source from `path`, or the built-in TEMPLATE."""
+    if not path:
+        return TEMPLATE
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def render_html(resume, template_source=TEMPLATE):
+    return Template(template_source).render(**resume)
+
+def write_pdf(html_file, pdf_file):
     try:
         from utils.pdf_converter import convert_html_to_pdf
         success = convert_html_to_pdf(html_file, pdf_file)
         if not success:
             print('PDF generation failed, but HTML file was created successfully')
+        return success
     except ImportError:
         print('PDF converter not available. HTML file generated successfully.')
         print('To generate PDF, install the required dependencies and run:')
         print(f'python convert_to_pdf.py --input {html_file} --output {pdf_file}')
+        return False
+
+def generate_resume(resume_data='optimized_resume.json', job_description='job_discription.txt', output_dir='resumes',
+                    role=None, company=None, template_source=TEMPLATE, pdf=True):
+    """
+    Render a resume JSON file to HTML (and optionally PDF) under output_dir/<Role>_<Company>/.
+
+    Returns:
+        tuple: (html_file, pdf_file) paths; pdf_file is None when pdf=False
+    """
+    resume = load_resume_data(resume_data)
+    full_output_dir, html_file, pdf_file = resolve_output_paths(resume, output_dir, role, company, job_description)
+    os.makedirs(full_output_dir, exist_ok=True)
+    jd_dest = os.path.join(full_output_dir, "job_description.txt")
+    try:
+        import shutil
+        shutil.copy2(job_description, jd_dest)
+    except Exception:
+        pass
+    html = render_html(resume, template_source)
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(html)
+    if not pdf:
+        return html_file, None
+    write_pdf(html_file, pdf_file)
+    return html_file, pdf_file
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate HTML resume with custom naming')
+    parser.add_argument('--role', '-r', help='Job role/position you are applying for (overrides JD extraction)')
+    parser.add_argument('--company', '-c', help='Company name you are applying to (overrides JD extraction)')
+    parser.add_argument('--output-dir', '-o', default='resumes', help='Output directory for generated files')
+    parser.add_argument('--resume-data', '-d', default='optimized_resume.json', help='Path to resume JSON data')
+    parser.add_argument('--job-description', '-j', default='job_discription.txt', help='Path to job description file')
+    parser.add_argument('--template', '-t', help='Path to a Jinja2 HTML template (defaults to the built-in template)')
+    args = parser.parse_args()
+
+    generate_resume(args.resume_data, args.job_description, args.output_dir,
+                    role=args.role, company=args.company, template_source=load_template(args.template))
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main() 
@@ -0,0 +1,299 @@
+"""
+Watch resume inputs and incrementally regenerate the resume on save.
+
+Stages:
+    resume.json / job description changed  -> re-optimize with Gemini, then render
+    optimized JSON / HTML template changed -> render HTML/PDF only (no LLM call)
+
+A live-reload preview of the latest HTML is served on http://localhost:<port>/.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from resume_to_html import generate_resume, load_template, write_pdf
+
+OPTIMIZE = 'optimize'
+RENDER = 'render'
+
+RELOAD_SCRIPT = '''
+<script>
+(function () {
+  var version = %d;
+  setInterval(function () {
+    fetch('/__version', {cache: 'no-store'}).then(function (r) { return r.text(); }).then(function (v) {
+      if (parseInt(v, 10) !== version) { location.reload(); }
+    }).catch(function () {});
+  }, 200);
+})();
+</script>
+'''
+
+
+def file_digest(path):
+    """Return a sha1 of the file contents, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class PreviewState:
+    """Latest rendered HTML and a version counter polled by the preview page."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = 0
+        self.html_file = None
+
+    def publish(self, html_file):
+        with self.lock:
+            self.html_file = html_file
+            self.version += 1
+
+    def snapshot(self):
+        with self.lock:
+            return self.version, self.html_file
+
+
+def make_preview_handler(state):
+    class PreviewHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            version, html_file = state.snapshot()
+            if self.path == '/__version':
+                self._send(str(version).encode('utf-8'), 'text/plain')
+                return
+            if self.path not in ('/', '/index.html'):
+                self.send_error(404)
+                return
+            if html_file and os.path.exists(html_file):
+                with open(html_file, 'r', encoding='utf-8') as f:
+                    html = f.read()
+            else:
+                html = '<html><body><p>Waiting for the first render...</p></body></html>'
+            script = RELOAD_SCRIPT % version
+            if '</body>' in html:
+                html = html.replace('</body>', script + '</body>', 1)
+            else:
+                html += script
+            self._send(html.encode('utf-8'), 'text/html; charset=utf-8')
+
+        def _send(self, body, content_type):
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Cache-Control', 'no-store')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return PreviewHandler
+
+
+class ResumeWatcher:
+    """Debounces file events and re-runs only the stages affected by them."""
+
+    def __init__(self, resume_file, job_file, optimized_file, output_dir, template_file=None,
+                 api_key=None, debounce=0.3, pdf=True, preview=None):
+        self.resume_file = os.path.abspath(resume_file)
+        self.job_file = os.path.abspath(job_file)
+        self.optimized_file = os.path.abspath(optimized_file)
+        self.template_file = os.path.abspath(template_file) if template_file else None
+        self.output_dir = output_dir
+        self.api_key = api_key
+        self.debounce = debounce
+        self.pdf = pdf
+        self.preview = preview
+        self.model = None
+
+        self.stages = {
+            self.resume_file: OPTIMIZE,
+            self.job_file: OPTIMIZE,
+            self.optimized_file: RENDER,
+        }
+        if self.template_file:
+            self.stages[self.template_file] = RENDER
+
+        # Content hashes of the inputs as of the last run, so no-op saves
+        # and our own writes to the optimized JSON do not retrigger work.
+        self.digests = {path: file_digest(path) for path in self.stages}
+        self.pending = set()
+        self.timer = None
+        self.lock = threading.Lock()
+        self.run_lock = threading.Lock()
+
+    def notify(self, path):
+        """Record a change to `path` and (re)start the debounce timer."""
+        path = os.path.abspath(path)
+        if path not in self.stages:
+            return
+        with self.lock:
+            self.pending.add(path)
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            paths, self.pending = self.pending, set()
+            self.timer = None
+        # Compare digests under run_lock so a change made while a stage is still
+        # running is checked against what that stage actually consumed.
+        with self.run_lock:
+            changed = {}
+            for path in paths:
+                digest = file_digest(path)
+                if digest is not None and digest != self.digests.get(path):
+                    changed[path] = digest
+            if not changed:
+                return
+            optimize_needed = any(self.stages[path] == OPTIMIZE for path in changed)
+            render_paths = [path for path in changed if self.stages[path] == RENDER]
+            names = ', '.join(sorted(os.path.basename(path) for path in changed))
+            print(f"\nChanged: {names}")
+            # Digests are only recorded once their stage succeeds, so a failed
+            # run is retried on the next save even if the content is the same.
+            optimized = optimize_needed and self.optimize()
+            if not (optimized or render_paths):
+                return
+            if self.render():
+                for path in render_paths:
+                    # optimize() already recorded the digest of the file it wrote
+                    if not (optimized and path == self.optimized_file):
+                        self.digests[path] = changed[path]
+
+    def optimize(self):
+        """Re-run the Gemini optimization and write the optimized JSON."""
+        try:
+            with open(self.resume_file, 'rb') as f:
+                resume_bytes = f.read()
+            with open(self.job_file, 'rb') as f:
+                job_bytes = f.read()
+            resume_json = json.loads(resume_bytes.decode('utf-8'))
+            job_description = job_bytes.decode('utf-8').strip()
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            print(f"Error reading inputs: {e}")
+            return False
+        if not job_description:
+            print(f"Error: {self.job_file} is empty!")
+            return False
+        if self.model is None:
+            if not self.api_key:
+                print("Error: no API key set; use --api-key or GEMINI_API_KEY to enable re-optimization.")
+                return False
+            from resume_optimizer import setup_gemini
+            self.model = setup_gemini(self.api_key)
+        from resume_optimizer import optimize_resume
+        print("Optimizing resume...")
+        started = time.perf_counter()
+        try:
+            optimized_resume = optimize_resume(resume_json, job_description, self.model, raise_on_error=True)
+        except Exception as e:
+            print(f"Error optimizing resume: {e}")
+            print(f"Keeping previous {os.path.basename(self.optimized_file)}.")
+            return False
+        with open(self.optimized_file, 'w', encoding='utf-8') as f:
+            json.dump(optimized_resume, f, indent=2)
+        # Record the inputs as they were read, not as they are now
+        self.digests[self.resume_file] = hashlib.sha1(resume_bytes).hexdigest()
+        self.digests[self.job_file] = hashlib.sha1(job_bytes).hexdigest()
+        self.digests[self.optimized_file] = file_digest(self.optimized_file)
+        print(f"✓ Optimized resume saved to: {self.optimized_file} ({time.perf_counter() - started:.1f}s)")
+        return True
+
+    def render(self):
+        """Render HTML, publish it to the preview, then write the PDF. Returns True if the HTML was rendered."""
+        if not os.path.exists(self.optimized_file):
+            print(f"Waiting for {self.optimized_file}...")
+            return False
+        started = time.perf_counter()
+        try:
+            template_source = load_template(self.template_file)
+            html_file, _ = generate_resume(self.optimized_file, self.job_file, self.output_dir,
+                                           template_source=template_source, pdf=False)
+        except Exception as e:
+            print(f"Error rendering resume: {e}")
+            return False
+        if self.preview:
+            self.preview.publish(html_file)
+        print(f"✓ HTML updated: {html_file} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+        if self.pdf:
+            write_pdf(html_file, os.path.splitext(html_file)[0] + '.pdf')
+        return True
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, watcher):
+        self.watcher = watcher
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher.notify(event.src_path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.watcher.notify(event.src_path)
+
+    def on_moved(self, event):
+        # Many editors save by writing a temp file and renaming it over the target.
+        if not event.is_directory:
+            self.watcher.notify(event.dest_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Watch resume inputs and regenerate on change')
+    parser.add_argument('--resume', default='resume.json', help='Path to base resume JSON')
+    parser.add_argument('--job-description', '-j', default='job_discription.txt', help='Path to job description file')
+    parser.add_argument('--resume-data', '-d', default='optimized_resume.json', help='Path to optimized resume JSON')
+    parser.add_argument('--template', '-t', help='Path to a Jinja2 HTML template (defaults to the built-in template)')
+    parser.add_argument('--output-dir', '-o', default='resumes', help='Output directory for generated files')
+    parser.add_argument('--api-key', default=os.environ.get('GEMINI_API_KEY'), help='Gemini API key (default: $GEMINI_API_KEY)')
+    parser.add_argument('--debounce', type=float, default=0.3, help='Seconds to wait for a burst of saves to settle')
+    parser.add_argument('--port', '-p', type=int, default=8000, help='Port for the live-reload preview (0 to disable)')
+    parser.add_argument('--no-pdf', action='store_true', help='Only render HTML')
+    args = parser.parse_args()
+
+    preview = None
+    if args.port:
+        preview = PreviewState()
+        server = ThreadingHTTPServer(('127.0.0.1', args.port), make_preview_handler(preview))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Live preview at http://localhost:{args.port}/")
+
+    watcher = ResumeWatcher(args.resume, args.job_description, args.resume_data, args.output_dir,
+                            template_file=args.template, api_key=args.api_key,
+                            debounce=args.debounce, pdf=not args.no_pdf, preview=preview)
+    with watcher.run_lock:
+        watcher.render()
+
+    observer = Observer()
+    handler = _EventHandler(watcher)
+    for directory in {os.path.dirname(path) for path in watcher.stages}:
+        observer.schedule(handler, directory, recursive=False)
+    observer.start()
+    print("Watching for changes. Press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observer.stop()
+        observer.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,17 @@ import subprocess
 import base64
 import json
 from glob import glob
+from utils.profile_store import ProfileStore
+
+# Profiles are loaded once per server process; lookups afterwards are in-memory
+@st.cache_resource
+def get_profile_store():
+    return ProfileStore(os.path.abspath("profiles"))
+
+@st.cache_resource
+def get_model():
+    from resume_optimizer import setup_gemini, API_KEY
+    return setup_gemini(API_KEY)
 
 # Display PDF in Streamlit
 def display_pdf(file_path):
@@ -30,9 +41,32 @@ def sanitize_filename(filename):
 def main():
     st.set_page_config(page_title="AI Resume Builder", layout="wide")
     col1, col2 = st.columns([1, 2])
+    store = get_profile_store()
     with col1:
+        with st.expander("Add candidate profile"):
+            new_name = st.text_input("Candidate name")
+            uploaded = st.file_uploader("Resume JSON", type=["json"])
+            if st.button("Save Profile") and new_name and uploaded:
+                try:
+                    saved = store.save(new_name, json.loads(uploaded.getvalue().decode("utf-8")))
+                    st.success(f"Saved {saved.name} (version {saved.version})")
+                except ValueError as e:
+                    st.error(f"Invalid resume JSON: {e}")
         st.markdown("## Job Description")
         job_description = st.text_area("Paste the job description here:", height=500)
+        profile = None
+        # Best keyword match with the pasted job description first
+        ranked = store.rank(job_description)
+        if ranked:
+            # Labels and the selection come from this one snapshot of the store
+            by_slug = {p.slug: p for p, _ in ranked}
+            scores = {p.slug: score for p, score in ranked}
+            slug = st.selectbox(
+                "Candidate",
+                list(by_slug),
+                format_func=lambda s: f"{by_slug[s].name} (v{by_slug[s].version}, match {scores[s]:.0%})",
+            )
+            profile = by_slug[slug]
         generate = st.button("Generate Resume", use_container_width=True)
     with col2:
         st.markdown("## Resume Preview")
@@ -44,20 +78,30 @@ def main():
                     f.write(job_description)
                 resumes_dir = os.path.abspath("resumes")
                 os.makedirs(resumes_dir, exist_ok=True)
-                # Copy base resume.json to resumes dir (if needed by optimizer)
-                base_resume = "resume.json"
-                temp_resume = os.path.join(resumes_dir, "resume.json")
-                if os.path.exists(base_resume):
-                    with open(base_resume, "r", encoding="utf-8") as src, open(temp_resume, "w", encoding="utf-8") as dst:
+                if profile:
+                    # Use the profile's precomputed prompt fragment instead of copying resume.json
+                    from resume_optimizer import optimize_resume
+                    optimized = optimize_resume(profile.data, job_description, get_model(),
+                                                resume_fragment=profile.prompt_fragment)
+                    with open(os.path.join(resumes_dir, "optimized_resume.json"), "w", encoding="utf-8") as f:
+                        json.dump(optimized, f, indent=2)
+                    with open(os.path.join(resumes_dir, "job_discription.txt"), "w", encoding="utf-8") as f:
+                        f.write(job_description)
+                else:
+                    # Copy base resume.json to resumes dir (if needed by optimizer)
+                    base_resume = "resume.json"
+                    temp_resume = os.path.join(resumes_dir, "resume.json")
+                    if os.path.exists(base_resume):
+                        with open(base_resume, "r", encoding="utf-8") as src, open(temp_resume, "w", encoding="utf-8") as dst:
+                            dst.write(src.read())
+                    # Copy job_discription.txt to resumes dir
+                    temp_jd = os.path.join(resumes_dir, "job_discription.txt")
+                    with open(jd_path, "r", encoding="utf-8") as src, open(temp_jd, "w", encoding="utf-8") as dst:
                         dst.write(src.read())
-                # Copy job_discription.txt to resumes dir
-                temp_jd = os.path.join(resumes_dir, "job_discription.txt")
-                with open(jd_path, "r", encoding="utf-8") as src, open(temp_jd, "w", encoding="utf-8") as dst:
-                    dst.write(src.read())
-                # Run resume_optimizer.py in resumes dir
-                subprocess.run([
-                    "python", os.path.abspath("resume_optimizer.py")
-                ], cwd=resumes_dir, check=True)
+                    # Run resume_optimizer.py in resumes dir
+                    subprocess.run([
+                        "python", os.path.abspath("resume_optimizer.py")
+                    ], cwd=resumes_dir, check=True)
                 # Run resume_to_html.py in resumes dir
                 subprocess.run([
                     "python", os.path.abspath("resume_to_html.py"), "--resume-data", "optimized_resume.json", "--job-description", "job_discription.txt", "--output-dir", resumes_dir
@@ -0,0 +1,168 @@
+import json
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+from utils.profile_store import ProfileStore, keyword_vector, validate_resume
+
+
+def make_resume(name, skills):
+    return {
+        'header': {'full_name': name, 'email': f"{name.split()[0].lower()}@example.com"},
+        'technical_skills': {'languages': skills},
+        'work_experience': [],
+    }
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def root(tmp_path):
+    return str(tmp_path / 'profiles')
+
+
+def test_save_creates_versions_with_cached_fragments(root):
+    store = ProfileStore(root)
+    store.save('Jane Doe', make_resume('Jane Doe', ['Python']))
+    profile = store.save('Jane Doe', make_resume('Jane Doe', ['Python', 'SQL']))
+
+    assert profile.slug == 'jane_doe'
+    assert profile.version == 2
+    assert store.versions('jane_doe') == [1, 2]
+    assert json.loads(profile.prompt_fragment) == profile.data
+    assert ': ' not in profile.prompt_fragment
+    assert profile.keywords['sql'] == 1
+    assert store.get_version('jane_doe', 1).data['technical_skills']['languages'] == ['Python']
+
+
+def test_store_loads_latest_versions_from_disk(root):
+    ProfileStore(root).save('Jane Doe', make_resume('Jane Doe', ['Python']))
+    profile = ProfileStore(root).get('jane_doe')
+    assert profile.name == 'Jane Doe'
+    assert profile.data == make_resume('Jane Doe', ['Python'])
+
+
+def test_missing_cache_files_are_rebuilt(root):
+    store = ProfileStore(root)
+    store.save('Jane Doe', make_resume('Jane Doe', ['Python']))
+    os.remove(os.path.join(root, 'jane_doe', 'v0001.prompt.txt'))
+    profile = ProfileStore(root).get('jane_doe')
+    assert json.loads(profile.prompt_fragment) == profile.data
+    assert os.path.exists(os.path.join(root, 'jane_doe', 'v0001.prompt.txt'))
+
+
+def test_slug_collision_with_different_name_is_rejected(root):
+    store = ProfileStore(root)
+    store.save('John Smith', make_resume('John Smith', ['Python']))
+    with pytest.raises(ValueError, match='already belongs to'):
+        store.save('john-smith', make_resume('john smith', ['Go']))
+    assert store.get('john_smith').version == 1
+    assert store.get('john_smith').name == 'John Smith'
+
+
+def test_name_is_stored_per_version(root):
+    store = ProfileStore(root)
+    store.save('John Smith', make_resume('John Smith', ['Python']))
+    store.save('John Smith', make_resume('John Smith', ['Go']))
+    assert store.get_version('john_smith', 1).name == 'John Smith'
+
+
+def test_invalid_resume_is_rejected(root):
+    store = ProfileStore(root)
+    with pytest.raises(ValueError):
+        store.save('Jane Doe', {'header': {}})
+    with pytest.raises(ValueError):
+        store.save('!!!', make_resume('Jane Doe', ['Python']))
+    with pytest.raises(ValueError):
+        validate_resume({'header': {'full_name': 'Jane'}, 'work_experience': {}})
+    assert store.list_profiles() == []
+
+
+def test_saves_from_another_store_are_picked_up(root):
+    app_store = ProfileStore(root)
+    cli_store = ProfileStore(root)
+    cli_store.save('Jane Doe', make_resume('Jane Doe', ['Python']))
+    bump_mtime(os.path.join(root, 'index.json'))
+    assert app_store.get('jane_doe') is not None
+    assert [p.slug for p in app_store.list_profiles()] == ['jane_doe']
+
+
+def test_failed_reload_keeps_previous_profiles_and_retries(root):
+    store = ProfileStore(root)
+    store.save('Jane Doe', make_resume('Jane Doe', ['Python']))
+
+    # Another process points the index at a version that is not written yet
+    index_path = os.path.join(root, 'index.json')
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({'jane_doe': {'name': 'Jane Doe', 'version': 2},
+                   'john_smith': {'name': 'John Smith', 'version': 1}}, f)
+    bump_mtime(index_path)
+    assert store.get('jane_doe').version == 1
+    assert store.get('john_smith') is None
+
+    other = ProfileStore(os.path.join(os.path.dirname(root), 'other'))
+    other.save('Jane Doe', make_resume('Jane Doe', ['Go']))
+    other.save('Jane Doe', make_resume('Jane Doe', ['Go']))
+    other.save('John Smith', make_resume('John Smith', ['Go']))
+    for slug, version in (('jane_doe', 2), ('john_smith', 1)):
+        os.makedirs(os.path.join(root, slug), exist_ok=True)
+        for suffix in ('.json', '.meta.json', '.prompt.txt', '.keywords.json'):
+            name = f"v{version:04d}{suffix}"
+            shutil.copy2(os.path.join(other.root, slug, name), os.path.join(root, slug, name))
+    bump_mtime(index_path)
+    assert store.get('jane_doe').version == 2
+    assert store.get('john_smith').name == 'John Smith'
+
+
+def test_lookups_never_miss_during_concurrent_reloads(root):
+    store = ProfileStore(root)
+    store.save('Jane Doe', make_resume('Jane Doe', ['Python']))
+    load_version = store._load_version
+
+    def slow_load_version(*args):
+        # Widen the reload window so a half-built dict would be observed
+        time.sleep(0.001)
+        return load_version(*args)
+    store._load_version = slow_load_version
+    writer = ProfileStore(root)
+    index_path = os.path.join(root, 'index.json')
+    misses = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            if store.get('jane_doe') is None:
+                misses.append(1)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for t in readers:
+        t.start()
+    for i in range(20):
+        writer.save(f"Candidate {i}", make_resume(f"Candidate {i}", ['Python']))
+        bump_mtime(index_path)
+    done.set()
+    for t in readers:
+        t.join()
+    assert misses == []
+    assert len(store.list_profiles()) == 21
+
+
+def test_rank_orders_by_keyword_match(root):
+    store = ProfileStore(root)
+    store.save('Jane Doe', make_resume('Jane Doe', ['**Python**', 'PyTorch', 'NLP']))
+    store.save('John Smith', make_resume('John Smith', ['Java', 'Spring', 'Kubernetes']))
+
+    ranked = store.rank('Senior NLP engineer with Python and PyTorch experience')
+    assert [p.slug for p, _ in ranked] == ['jane_doe', 'john_smith']
+    assert ranked[0][1] > ranked[1][1]
+    assert [score for _, score in store.rank('')] == [0.0, 0.0]
+
+
+def test_keyword_vector_ignores_markdown_and_stopwords():
+    assert keyword_vector('**Python** and the **SQL**, python') == {'python': 2, 'sql': 1}
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+pytest.importorskip('watchdog')
+pytest.importorskip('jinja2')
+
+from resume_watch import ResumeWatcher
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+
+
+def sha1(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = {
+        'resume': tmp_path / 'resume.json',
+        'jd': tmp_path / 'job_discription.txt',
+        'optimized': tmp_path / 'optimized_resume.json',
+        'template': tmp_path / 'theme.html',
+    }
+    write(paths['resume'], '{"header": {"full_name": "Jane"}}')
+    write(paths['jd'], 'Data Scientist at Google')
+    write(paths['optimized'], '{"header": {"full_name": "Jane"}}')
+    write(paths['template'], '<html><body>{{ full_name }}</body></html>')
+    return paths
+
+
+@pytest.fixture
+def watcher(files, tmp_path):
+    w = ResumeWatcher(files['resume'], files['jd'], files['optimized'], str(tmp_path / 'out'),
+                      template_file=files['template'], api_key='key', debounce=0.05, pdf=False)
+    w.calls = []
+    w.render = lambda: w.calls.append('render') or True
+    return w
+
+
+@pytest.fixture
+def fake_optimizer(monkeypatch):
+    module = types.ModuleType('resume_optimizer')
+    module.optimize_resume = lambda resume_json, job_description, model, raise_on_error=False: dict(
+        resume_json, role='Data Scientist')
+    monkeypatch.setitem(sys.modules, 'resume_optimizer', module)
+    return module
+
+
+def test_notify_debounces_burst_into_one_flush(watcher, files):
+    flushed = []
+    watcher.flush = lambda: flushed.append(set(watcher.pending))
+    for _ in range(5):
+        watcher.notify(str(files['template']))
+        watcher.notify(str(files['optimized']))
+    time.sleep(0.2)
+    assert flushed == [{str(files['template']), str(files['optimized'])}]
+
+
+def test_notify_ignores_unwatched_paths(watcher, tmp_path):
+    watcher.notify(str(tmp_path / 'notes.txt'))
+    assert watcher.timer is None
+    assert not watcher.pending
+
+
+def test_unchanged_content_is_skipped(watcher, files):
+    write(files['template'], files['template'].read_text(encoding='utf-8'))
+    watcher.pending = {str(files['template'])}
+    watcher.flush()
+    assert watcher.calls == []
+
+
+def test_template_change_renders_without_optimizing(watcher, files):
+    watcher.optimize = lambda: watcher.calls.append('optimize') or True
+    write(files['template'], '<html><body>{{ title }}</body></html>')
+    watcher.pending = {str(files['template'])}
+    watcher.flush()
+    assert watcher.calls == ['render']
+    assert watcher.digests[str(files['template'])] == sha1('<html><body>{{ title }}</body></html>')
+
+
+def test_jd_change_optimizes_then_renders(watcher, files, fake_optimizer):
+    watcher.model = object()
+    write(files['jd'], 'ML Engineer at Meta')
+    watcher.pending = {str(files['jd'])}
+    watcher.flush()
+    assert watcher.calls == ['render']
+    assert json.loads(files['optimized'].read_text(encoding='utf-8'))['role'] == 'Data Scientist'
+    assert watcher.digests[str(files['jd'])] == sha1('ML Engineer at Meta')
+
+
+def test_failed_optimize_still_renders_and_retries(watcher, files):
+    watcher.api_key = None
+    write(files['jd'], 'ML Engineer at Meta')
+    write(files['template'], '<html><body>v2</body></html>')
+    watcher.pending = {str(files['jd']), str(files['template'])}
+    watcher.flush()
+    assert watcher.calls == ['render']
+    assert watcher.digests[str(files['jd'])] == sha1('Data Scientist at Google')
+
+    # Same JD content again: not recorded as done, so it is retried
+    watcher.calls.clear()
+    attempts = []
+    watcher.optimize = lambda: attempts.append(1) and False
+    watcher.pending = {str(files['jd'])}
+    watcher.flush()
+    assert attempts == [1]
+
+
+def test_optimizer_error_keeps_previous_output(watcher, files, fake_optimizer):
+    def fail(*args, **kwargs):
+        raise RuntimeError('quota exceeded')
+    fake_optimizer.optimize_resume = fail
+    watcher.model = object()
+    before = files['optimized'].read_text(encoding='utf-8')
+    write(files['resume'], '{"header": {"full_name": "Jane Doe"}}')
+    watcher.pending = {str(files['resume'])}
+    watcher.flush()
+    assert files['optimized'].read_text(encoding='utf-8') == before
+    assert watcher.calls == []
+
+
+def test_revert_during_optimize_is_picked_up(watcher, files, fake_optimizer):
+    reverted = files['resume'].read_text(encoding='utf-8')
+    in_flight = threading.Event()
+    release = threading.Event()
+    seen = []
+
+    def slow_optimize(resume_json, job_description, model, raise_on_error=False):
+        seen.append(resume_json)
+        if len(seen) == 1:
+            in_flight.set()
+            release.wait(2)
+        return resume_json
+    fake_optimizer.optimize_resume = slow_optimize
+    watcher.model = object()
+
+    write(files['resume'], '{"header": {"full_name": "Jane Doe"}}')
+    watcher.pending = {str(files['resume'])}
+    first = threading.Thread(target=watcher.flush)
+    first.start()
+    assert in_flight.wait(2)
+
+    # The user reverts resume.json while the model call is in flight
+    write(files['resume'], reverted)
+    watcher.pending = {str(files['resume'])}
+    second = threading.Thread(target=watcher.flush)
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join(2)
+    second.join(2)
+
+    assert len(seen) == 2
+    assert json.loads(files['optimized'].read_text(encoding='utf-8')) == json.loads(reverted)
+    assert watcher.digests[str(files['resume'])] == sha1(reverted)
@@ -1,7 +1,12 @@
-import pdfkit
 import os
 import sys
 
+try:
+    import pdfkit
+except ImportError:
+    # Optional: only needed for PDF output, not for the rest of utils
+    pdfkit = None
+
 class PDFConverter:
     """Utility class for converting HTML files to PDF using wkhtmltopdf"""
     
@@ -34,6 +39,10 @@ class PDFConverter:
         Returns:
             bool: True if successful, False otherwise
         """
+        if pdfkit is None:
+            print("pdfkit is not installed. Install it with: pip install pdfkit")
+            return False
+
         if not self.wkhtmltopdf_path:
             print("wkhtmltopdf not found in common locations!")
             print("\nPlease do one of the following:")
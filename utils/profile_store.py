@@ -0,0 +1,284 @@
+import json
+import math
+import os
+import re
+import sys
+import threading
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r'[a-z][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*')
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into', 'is', 'it', 'of', 'on',
+    'or', 'our', 'that', 'the', 'their', 'this', 'to', 'using', 'via', 'we', 'with', 'you', 'your',
+}
+LIST_SECTIONS = ['education', 'professional_summary', 'work_experience', 'experience', 'projects',
+                 'certifications', 'publications', 'awards']
+DICT_SECTIONS = ['technical_skills', 'skills']
+
+
+def slugify(name):
+    """Turn a candidate name into a stable directory key"""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+def iter_strings(data):
+    if isinstance(data, dict):
+        for value in data.values():
+            yield from iter_strings(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from iter_strings(item)
+    elif isinstance(data, str):
+        yield data
+
+
+def keyword_vector(text):
+    """
+    Build a term-frequency vector from free text
+
+    Args:
+        text (str): Text to tokenize (markdown ** markers are ignored)
+
+    Returns:
+        dict: Lowercased keyword -> count
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    return dict(Counter(t for t in tokens if t not in STOPWORDS and len(t) > 1))
+
+
+def cosine_similarity(a, b):
+    if not a or not b:
+        return 0.0
+    dot = sum(count * b.get(term, 0) for term, count in a.items())
+    norm = math.sqrt(sum(v * v for v in a.values())) * math.sqrt(sum(v * v for v in b.values()))
+    return dot / norm if norm else 0.0
+
+
+def validate_resume(data):
+    """
+    Check that resume data has the structure the optimizer expects
+
+    Raises:
+        ValueError: If the resume is missing required fields or has malformed sections
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Resume data must be a JSON object')
+    header = data.get('header')
+    if not isinstance(header, dict):
+        raise ValueError("Resume data must have a 'header' object")
+    if not str(header.get('full_name', '')).strip():
+        raise ValueError("Resume header must include a non-empty 'full_name'")
+    for key in LIST_SECTIONS:
+        if key in data and not isinstance(data[key], list):
+            raise ValueError(f"Resume section '{key}' must be a list")
+    for key in DICT_SECTIONS:
+        if key in data and not isinstance(data[key], dict):
+            raise ValueError(f"Resume section '{key}' must be an object")
+
+
+class CandidateProfile:
+    """A saved resume version with its precomputed prompt fragment and keywords"""
+
+    def __init__(self, slug, name, version, data, prompt_fragment, keywords):
+        self.slug = slug
+        self.name = name
+        self.version = version
+        self.data = data
+        self.prompt_fragment = prompt_fragment
+        self.keywords = keywords
+
+
+class ProfileStore:
+    """
+    Versioned store of candidate resume JSONs
+
+    Layout on disk:
+        <root>/index.json                  slug -> {name, version}
+        <root>/<slug>/v0001.json           resume data as saved
+        <root>/<slug>/v0001.meta.json      display name the version was saved under
+        <root>/<slug>/v0001.prompt.txt     compact JSON used in the optimizer prompt
+        <root>/<slug>/v0001.keywords.json  keyword vector
+
+    The latest version of every profile is held in memory, so get() is a dict lookup.
+    The index mtime is checked on each lookup, so saves from another process
+    (e.g. the CLI below) are picked up without a restart. Reloads and saves
+    swap in a fully built dict under a lock, so one store can be shared
+    across threads.
+    """
+
+    def __init__(self, root='profiles'):
+        self.root = root
+        self.index_path = os.path.join(root, 'index.json')
+        self.profiles = {}
+        self.index_mtime = None
+        self.lock = threading.RLock()
+        self.load()
+
+    def _index_mtime(self):
+        try:
+            return os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def load(self):
+        """Read the index and the cached fragments for each profile's latest version"""
+        with self.lock:
+            mtime = self._index_mtime()
+            profiles = {}
+            if mtime is not None:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                for slug, entry in index.items():
+                    profiles[slug] = self._load_version(slug, entry['name'], entry['version'])
+            # Only publish once everything loaded, so a failed load is retried
+            self.profiles = profiles
+            self.index_mtime = mtime
+
+    def refresh(self):
+        """Reload if index.json changed since it was last read"""
+        if self._index_mtime() == self.index_mtime:
+            return
+        with self.lock:
+            if self._index_mtime() == self.index_mtime:
+                return
+            try:
+                self.load()
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: could not reload profiles, keeping previous ones: {e}")
+
+    def _version_path(self, slug, version, suffix):
+        return os.path.join(self.root, slug, f"v{version:04d}{suffix}")
+
+    def _load_version(self, slug, name, version):
+        meta_path = self._version_path(slug, version, '.meta.json')
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                name = json.load(f)['name']
+        prompt_path = self._version_path(slug, version, '.prompt.txt')
+        keywords_path = self._version_path(slug, version, '.keywords.json')
+        if not (os.path.exists(prompt_path) and os.path.exists(keywords_path)):
+            # Cache files missing (e.g. copied in by hand): rebuild them from the saved data
+            with open(self._version_path(slug, version, '.json'), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return self._write_cache(slug, name, version, data)
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            prompt_fragment = f.read()
+        with open(keywords_path, 'r', encoding='utf-8') as f:
+            keywords = json.load(f)
+        return CandidateProfile(slug, name, version, json.loads(prompt_fragment), prompt_fragment, keywords)
+
+    def _write_cache(self, slug, name, version, data):
+        prompt_fragment = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        keywords = keyword_vector(' '.join(iter_strings(data)))
+        with open(self._version_path(slug, version, '.prompt.txt'), 'w', encoding='utf-8') as f:
+            f.write(prompt_fragment)
+        with open(self._version_path(slug, version, '.keywords.json'), 'w', encoding='utf-8') as f:
+            json.dump(keywords, f)
+        return CandidateProfile(slug, name, version, data, prompt_fragment, keywords)
+
+    def _write_index(self, profiles):
+        index = {slug: {'name': p.name, 'version': p.version} for slug, p in profiles.items()}
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def save(self, name, data):
+        """
+        Validate and save a new version of a candidate's resume
+
+        Args:
+            name (str): Candidate display name
+            data (dict): Resume JSON data
+
+        Returns:
+            CandidateProfile: The newly saved version
+
+        Raises:
+            ValueError: If the name or resume data is invalid, or the name collides
+                with a different candidate's profile
+        """
+        slug = slugify(name)
+        if not slug:
+            raise ValueError('Candidate name must contain letters or digits')
+        validate_resume(data)
+        with self.lock:
+            self.refresh()
+            current = self.profiles.get(slug)
+            if current and current.name != name:
+                raise ValueError(f"Profile '{slug}' already belongs to '{current.name}'; "
+                                 f"save under that exact name or choose a distinct one")
+            version = current.version + 1 if current else 1
+            os.makedirs(os.path.join(self.root, slug), exist_ok=True)
+            with open(self._version_path(slug, version, '.json'), 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(self._version_path(slug, version, '.meta.json'), 'w', encoding='utf-8') as f:
+                json.dump({'name': name}, f, ensure_ascii=False)
+            profile = self._write_cache(slug, name, version, data)
+            profiles = dict(self.profiles)
+            profiles[slug] = profile
+            self._write_index(profiles)
+            self.profiles = profiles
+            self.index_mtime = self._index_mtime()
+            return profile
+
+    def get(self, slug):
+        """Return the latest version of a profile, or None"""
+        self.refresh()
+        return self.profiles.get(slug)
+
+    def get_version(self, slug, version):
+        """Load a specific saved version of a profile"""
+        current = self.get(slug)
+        if current is None:
+            raise KeyError(slug)
+        if version == current.version:
+            return current
+        return self._load_version(slug, current.name, version)
+
+    def versions(self, slug):
+        """List the saved version numbers of a profile"""
+        directory = os.path.join(self.root, slug)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(int(f[1:5]) for f in os.listdir(directory) if re.fullmatch(r'v\d{4}\.json', f))
+
+    def list_profiles(self):
+        self.refresh()
+        return sorted(self.profiles.values(), key=lambda p: p.name.lower())
+
+    def rank(self, job_description):
+        """
+        Order profiles by keyword similarity to a job description
+
+        Returns:
+            list: (profile, score) pairs, best match first
+        """
+        jd_keywords = keyword_vector(job_description)
+        scored = [(p, cosine_similarity(p.keywords, jd_keywords)) for p in self.list_profiles()]
+        return sorted(scored, key=lambda item: item[1], reverse=True)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Manage candidate resume profiles')
+    parser.add_argument('--root', default='profiles', help='Profile store directory')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    add_parser = subparsers.add_parser('add', help='Save a resume JSON as a new profile version')
+    add_parser.add_argument('name', help='Candidate name')
+    add_parser.add_argument('resume', help='Path to resume JSON')
+    subparsers.add_parser('list', help='List saved profiles')
+    args = parser.parse_args()
+
+    store = ProfileStore(args.root)
+    if args.command == 'add':
+        try:
+            with open(args.resume, 'r', encoding='utf-8') as f:
+                profile = store.save(args.name, json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Saved {profile.name} ({profile.slug}) version {profile.version}")
+    else:
+        for profile in store.list_profiles():
+            print(f"{profile.slug}\t{profile.name}\tv{profile.version}")